@@ -26,14 +26,25 @@ def analyze_video_cli(
         help="Whether to perform content analysis on the video (speech-to-text, etc.).",
         rich_help_panel="Analysis Options"
     )] = True,
+    deduplicate: Annotated[bool, typer.Option(
+        "--deduplicate/--no-deduplicate",
+        help="Whether to cluster near-duplicate comments and score one representative per cluster.",
+        rich_help_panel="Analysis Options"
+    )] = True,
+    downweight_duplicates: Annotated[bool, typer.Option(
+        "--downweight-duplicates/--no-downweight-duplicates",
+        help="Whether each near-duplicate cluster should count once in the sentiment statistics and keyword cloud.",
+        rich_help_panel="Analysis Options"
+    )] = False,
 ):
     """Analyze a YouTube video URL and generate a sentiment report."""
     typer.echo(f"Starting analysis for URL: {url}")
     typer.echo(f"Content analysis enabled: {content_analysis}")
+    typer.echo(f"Deduplication enabled: {deduplicate}")
 
     analysis_service = AnalysisService()
     try:
-        report = asyncio.run(analysis_service.analyze_video(url, content_analysis))
+        report = asyncio.run(analysis_service.analyze_video(url, content_analysis, deduplicate, downweight_duplicates))
         typer.echo("\n--- Analysis Report ---")
         typer.echo(json.dumps(report.model_dump(), indent=2, ensure_ascii=False))
         typer.echo("\nAnalysis complete.")
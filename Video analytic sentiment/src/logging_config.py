@@ -1,11 +1,183 @@
+import atexit
+import contextvars
+import copy
+import itertools
+import json
 import logging
+import logging.handlers
+import os
+import queue
+from typing import Dict, Optional, TextIO
 
-def setup_logging():
-    """Configures basic logging for the application."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()
-        ]
-    )
\ No newline at end of file
+# Correlation ids attached to every record logged from the current request or job.
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+job_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("job_id", default=None)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_DEBUG_SAMPLE_RATE = 100
+
+# Attributes every LogRecord has; anything else was passed through ``extra=``.
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id", "job_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+_debug_sample_rate = DEFAULT_DEBUG_SAMPLE_RATE
+
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the request/job ids of the context that logged them.
+
+    Must run on the producing side of the queue, since context variables are
+    not visible from the listener thread.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.job_id = job_id_var.get()
+        return True
+
+
+class SampledLogger:
+    """Wraps a logger for hot paths: DEBUG calls are sampled before a LogRecord is built.
+
+    Only one in every ``LOG_DEBUG_SAMPLE_RATE`` debug calls (as configured by
+    ``setup_logging``) reaches the wrapped logger, so skipped calls cost a level
+    check and a counter increment. Other levels pass straight through.
+    """
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self._counter = itertools.count()
+
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        # itertools.count is atomic under the GIL, so no lock is needed.
+        if next(self._counter) % _debug_sample_rate:
+            return
+        # Skip this wrapper frame so records point at the caller.
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.logger.debug(msg, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.logger, name)
+
+
+def get_sampled_logger(name: str) -> SampledLogger:
+    """Returns a SampledLogger around ``logging.getLogger(name)``."""
+    return SampledLogger(logging.getLogger(name))
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including correlation ids and extras."""
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "job_id": getattr(record, "job_id", None),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SnapshotQueueHandler(logging.handlers.QueueHandler):
+    """Queues a snapshot of each record, leaving layout and I/O to the listener.
+
+    Like the stock ``QueueHandler.prepare``, the message and traceback are
+    rendered in the caller so later mutation of logged arguments cannot leak
+    into the output and traceback frames are released immediately. Unlike
+    it, the text is kept apart in ``message`` and ``exc_text`` so the
+    listener's formatter (plain or JSON) still lays out each field itself.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_logger_levels(spec: str) -> Dict[str, str]:
+    """Parses a "logger=LEVEL,other.logger=LEVEL" string into a mapping."""
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level: Optional[str] = None, json_output: Optional[bool] = None,
+                  logger_levels: Optional[Dict[str, str]] = None, debug_sample_rate: Optional[int] = None,
+                  stream: Optional[TextIO] = None) -> logging.handlers.QueueListener:
+    """Configures non-blocking logging for the application.
+
+    Records are pushed onto an in-memory queue and written by a background
+    listener thread, so callers never block on the output stream. Only the
+    handler installed by a previous call is replaced; other root handlers
+    (an embedding app's, pytest's caplog) are left in place. Unset
+    arguments fall back to the LOG_LEVEL, LOG_FORMAT ("text" or "json"),
+    LOG_LEVELS ("logger=LEVEL,...") and LOG_DEBUG_SAMPLE_RATE environment variables.
+
+    Args:
+        level (str, optional): Root log level. Defaults to INFO.
+        json_output (bool, optional): Emit JSON lines instead of plain text.
+        logger_levels (Dict[str, str], optional): Per-logger level overrides.
+        debug_sample_rate (int, optional): Keep one in N debug calls made through a SampledLogger.
+        stream (TextIO, optional): Output stream. Defaults to stderr.
+
+    Returns:
+        logging.handlers.QueueListener: The running listener.
+    """
+    global _listener, _queue_handler, _debug_sample_rate
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    if json_output is None:
+        json_output = os.getenv("LOG_FORMAT", "text").lower() == "json"
+    if logger_levels is None:
+        logger_levels = parse_logger_levels(os.getenv("LOG_LEVELS", ""))
+    if debug_sample_rate is None:
+        debug_sample_rate = int(os.getenv("LOG_DEBUG_SAMPLE_RATE", str(DEFAULT_DEBUG_SAMPLE_RATE)))
+
+    stop_logging()
+    _debug_sample_rate = max(1, debug_sample_rate)
+
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(JsonFormatter() if json_output else logging.Formatter(TEXT_FORMAT))
+
+    queue_handler = SnapshotQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    _queue_handler = queue_handler
+    root.setLevel(level)
+    for name, logger_level in logger_levels.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Detaches the queue handler, then flushes queued records and stops the listener."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -1,9 +1,10 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel, HttpUrl
 from src.services.analysis_service import AnalysisService
 from src.models.domain import AnalysisReport
-from src.logging_config import setup_logging
+from src.logging_config import setup_logging, request_id_var
 import logging
+import uuid
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
@@ -29,16 +30,32 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+@app.middleware("http")
+async def bind_request_id(request: Request, call_next):
+    # Tag every log record of this request with a correlation id, reusing the caller's if given.
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 class AnalyzeRequest(BaseModel):
     url: HttpUrl
     content_analysis: bool = True
+    deduplicate: bool = True
+    downweight_duplicates: bool = False
 
 @app.post("/analyze", response_model=AnalysisReport)
 async def analyze_video_endpoint(request: AnalyzeRequest):
     logger.info(f"Received analysis request for URL: {request.url}, content_analysis: {request.content_analysis}")
     analysis_service = AnalysisService()
     try:
-        report = await analysis_service.analyze_video(str(request.url), request.content_analysis)
+        report = await analysis_service.analyze_video(
+            str(request.url), request.content_analysis, request.deduplicate, request.downweight_duplicates
+        )
         return report
     except Exception as e:
         logger.error(f"Error during video analysis for {request.url}: {e}", exc_info=True)
@@ -12,6 +12,7 @@ class Comment(BaseModel):
     id: str
     text: str
     analyzed_sentiment: str
+    duplicate_of: Optional[str] = None # Id of the cluster representative whose sentiment was reused
 
 class SentimentStatistics(BaseModel):
     """Represents the aggregated sentiment statistics."""
@@ -24,6 +25,20 @@ class KeywordCloudItem(BaseModel):
     text: str
     value: int
 
+class DuplicateCluster(BaseModel):
+    """Represents a group of near-duplicate comments scored through one representative."""
+    representative_id: str
+    representative_text: str
+    size: int
+
+class DeduplicationSummary(BaseModel):
+    """Represents the outcome of near-duplicate comment clustering."""
+    total_comments: int
+    unique_comments: int
+    spam_share: float # Share of comments in clusters of at least spam_min_cluster_size
+    downweighted: bool
+    clusters: List[DuplicateCluster]
+
 class AnalysisReport(BaseModel):
     """Represents the comprehensive sentiment analysis report for a video."""
     video: Video
@@ -32,4 +47,5 @@ class AnalysisReport(BaseModel):
     keyword_cloud: List[KeywordCloudItem]
     conclusion: str
     warnings: List[str]
-    topic_sentiments: Dict[str, Any] # Added for topic-specific sentiment
\ No newline at end of file
+    topic_sentiments: Dict[str, Any] # Added for topic-specific sentiment
+    deduplication: Optional[DeduplicationSummary] = None
\ No newline at end of file
@@ -4,23 +4,40 @@ from collections import Counter
 import re
 import os
 import subprocess
+import uuid
 
-from src.models.domain import Video, Comment, AnalysisReport, SentimentStatistics, KeywordCloudItem
+from src.models.domain import Video, Comment, AnalysisReport, SentimentStatistics, KeywordCloudItem, DuplicateCluster, DeduplicationSummary
 from src.services.youtube_service import YouTubeService
 from src.services.sentiment_service import SentimentService
 from src.services.speech_to_text_service import SpeechToTextService
+from src.services.deduplication_service import DeduplicationService
+from src.logging_config import job_id_var
 
 logger = logging.getLogger(__name__)
 
 class AnalysisService:
     """Orchestrates the video sentiment analysis process."""
+    # Clusters at least this large are counted as copy-paste spam in the report.
+    SPAM_MIN_CLUSTER_SIZE = 3
+
     def __init__(self, session_id: str = None):
         self.tiktok_service = TikTokService(session_id=session_id)
         self.sentiment_service = SentimentService()
         self.speech_to_text_service = SpeechToTextService()
-
-    async def analyze_video(self, url: str, content_analysis: bool = True) -> AnalysisReport:
-        logger.info(f"Starting analysis for video URL: {url}, content_analysis: {content_analysis}")
+        self.deduplication_service = DeduplicationService()
+
+    async def analyze_video(self, url: str, content_analysis: bool = True, deduplicate: bool = True,
+                            downweight_duplicates: bool = False) -> AnalysisReport:
+        # Tag every log record of this analysis with a job id, restoring the previous one afterwards.
+        token = job_id_var.set(uuid.uuid4().hex)
+        try:
+            return await self._analyze_video(url, content_analysis, deduplicate, downweight_duplicates)
+        finally:
+            job_id_var.reset(token)
+
+    async def _analyze_video(self, url: str, content_analysis: bool, deduplicate: bool,
+                             downweight_duplicates: bool) -> AnalysisReport:
+        logger.info(f"Starting analysis for video URL: {url}, content_analysis: {content_analysis}, deduplicate: {deduplicate}")
         warnings = []
 
         # 1. Fetch video info and comments
@@ -77,31 +94,53 @@ class AnalysisService:
         analyzed_comments: List[Comment] = []
         sentiment_counts = Counter()
         all_comment_words = []
+        deduplication_summary = None
 
         if not raw_comments:
             warnings.append("No comments found for this video.")
         else:
-            for raw_comment in raw_comments:
-                comment_text = raw_comment.get("text", "")
+            comment_texts = [raw_comment.get("text", "") for raw_comment in raw_comments]
+            comment_langs = [self._detect_language(comment_text) for comment_text in comment_texts]
+
+            # Group near-duplicates so each cluster is scored once through its representative
+            if deduplicate:
+                representatives = self.deduplication_service.find_clusters(comment_texts).tolist()
+            else:
+                representatives = list(range(len(comment_texts)))
+            cluster_sizes = Counter(representatives)
+            unique_positions = sorted(cluster_sizes)
+
+            # Score all representatives in one batch so vectorized backends can amortize their work.
+            unique_sentiments = self.sentiment_service.analyze_sentiment_batch(
+                [comment_texts[position] for position in unique_positions],
+                [comment_langs[position] for position in unique_positions],
+            )
+            sentiment_by_representative = dict(zip(unique_positions, unique_sentiments))
+
+            for position, (raw_comment, comment_text, lang) in enumerate(zip(raw_comments, comment_texts, comment_langs)):
                 comment_id = raw_comment.get("id", "")
-                
-                # Determine language for sentiment analysis (simplified for now)
-                # In a real app, you'd use a language detection library
-                lang = "en" # Default to English
-                # Simple heuristic: if Vietnamese characters are present, assume Vietnamese
-                if re.search(r'[àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]', comment_text, re.IGNORECASE):
-                    lang = "vi"
-
-                sentiment = self.sentiment_service.analyze_sentiment(comment_text, lang=lang)
-                analyzed_comments.append(Comment(id=comment_id, text=comment_text, analyzed_sentiment=sentiment))
-                sentiment_counts[sentiment.lower()] += 1
+                representative = representatives[position]
+                sentiment = sentiment_by_representative[representative]
+                duplicate_of = raw_comments[representative].get("id", "") if representative != position else None
+                analyzed_comments.append(Comment(id=comment_id, text=comment_text, analyzed_sentiment=sentiment, duplicate_of=duplicate_of))
+
+                # Down-weighting makes each cluster count once in the stats and the word cloud
+                if downweight_duplicates:
+                    sentiment_counts[sentiment.lower()] += 1 / cluster_sizes[representative]
+                    if duplicate_of is not None:
+                        continue
+                else:
+                    sentiment_counts[sentiment.lower()] += 1
 
                 # For word cloud
                 words = re.findall(r'\b\w+\b', comment_text.lower())
                 all_comment_words.extend([word for word in words if len(word) > 2 and word not in self._get_stopwords(lang)])
 
+            if deduplicate:
+                deduplication_summary = self._summarize_duplicates(raw_comments, comment_texts, cluster_sizes, downweight_duplicates)
+
         # 4. Calculate sentiment statistics
-        total_comments = len(analyzed_comments)
+        total_comments = sum(sentiment_counts.values())
         sentiment_stats = SentimentStatistics(
             positive=sentiment_counts["positive"] / total_comments if total_comments else 0,
             negative=sentiment_counts["negative"] / total_comments if total_comments else 0,
@@ -132,11 +171,40 @@ class AnalysisService:
             keyword_cloud=keyword_cloud,
             conclusion=conclusion,
             warnings=warnings,
-            topic_sentiments=topic_sentiments # Add topic sentiments to report
+            topic_sentiments=topic_sentiments, # Add topic sentiments to report
+            deduplication=deduplication_summary
         )
         logger.info(f"Analysis complete for {url}")
         return report
 
+    def _detect_language(self, text: str) -> str:
+        # Determine language for sentiment analysis (simplified for now)
+        # In a real app, you'd use a language detection library
+        # Simple heuristic: if Vietnamese characters are present, assume Vietnamese
+        if re.search(r'[àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]', text, re.IGNORECASE):
+            return "vi"
+        return "en" # Default to English
+
+    def _summarize_duplicates(self, raw_comments: List[Dict[str, Any]], comment_texts: List[str],
+                              cluster_sizes: Counter, downweighted: bool) -> DeduplicationSummary:
+        total_comments = len(comment_texts)
+        spam_comments = sum(size for size in cluster_sizes.values() if size >= self.SPAM_MIN_CLUSTER_SIZE)
+        clusters = [
+            DuplicateCluster(
+                representative_id=raw_comments[representative].get("id", ""),
+                representative_text=comment_texts[representative],
+                size=size,
+            )
+            for representative, size in cluster_sizes.most_common(10) if size > 1
+        ]
+        return DeduplicationSummary(
+            total_comments=total_comments,
+            unique_comments=len(cluster_sizes),
+            spam_share=spam_comments / total_comments if total_comments else 0,
+            downweighted=downweighted,
+            clusters=clusters,
+        )
+
     def _get_stopwords(self, lang: str) -> List[str]:
         # Placeholder for stopwords. In a real app, load from a file or library.
         if lang == "en":
@@ -0,0 +1,146 @@
+import logging
+import re
+import unicodedata
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_NON_WORD_PATTERN = re.compile(r"[^\w]+", re.UNICODE)
+
+
+class DeduplicationService:
+    """Groups near-duplicate comments using MinHash signatures and LSH banding.
+
+    Each comment is reduced to a set of character shingles, summarized by a
+    MinHash signature, and split into bands; comments sharing any band bucket
+    become candidates and are merged when their estimated Jaccard similarity
+    reaches ``threshold``. Every step is linear in the number of comments apart
+    from the per-band ``np.unique`` sort.
+
+    The default 16 bands of 4 rows put the LSH S-curve near (1/16)**(1/4) ~ 0.5,
+    so pairs at ``threshold`` become candidates about 99% of the time and the
+    signature comparison alone decides the merge. Fewer, wider bands would
+    push the curve above ``threshold`` and silently drop real near-duplicates.
+    """
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 5,
+                 threshold: float = 0.7, chunk_shingles: int = 1 << 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands}).")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        # Caps the shingles hashed together, bounding the (num_perm, shingles) temporary.
+        self.chunk_shingles = chunk_shingles
+        rng = np.random.RandomState(seed)
+        # Multiply-shift hashing: (a * x + b) mod 2**64, keeping the top 32 bits.
+        # The uint64 wrap-around does the modulo, which is far cheaper than a prime modulus.
+        self._a = rng.randint(0, 1 << 64, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 64, size=(num_perm, 1), dtype=np.uint64)
+
+    def _normalize(self, text: str) -> str:
+        return _NON_WORD_PATTERN.sub(" ", unicodedata.normalize("NFC", text).lower()).strip()
+
+    def _shingle_hashes(self, normalized: List[str]):
+        """Hashes every character shingle of a chunk of normalized texts in one vectorized pass.
+
+        Returns:
+            tuple: The 32-bit shingle hashes of all texts concatenated, and the
+            offset of each text's first shingle in that array.
+        """
+        # Pad short texts so every text yields at least one shingle.
+        normalized = [text.ljust(self.shingle_size) for text in normalized]
+        lengths = np.array([len(text) for text in normalized], dtype=np.int64)
+        codepoints = np.frombuffer("".join(normalized).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+        n_windows = len(codepoints) - self.shingle_size + 1
+        rolling = np.zeros(n_windows, dtype=np.uint64)
+        for offset in range(self.shingle_size):
+            rolling = (rolling * np.uint64(1000003) + codepoints[offset:offset + n_windows]) & _MAX_HASH
+
+        # Keep only windows that start and end inside the same text.
+        window_counts = lengths - self.shingle_size + 1
+        window_offsets = np.concatenate(([0], np.cumsum(window_counts)[:-1]))
+        text_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        positions = np.arange(window_counts.sum()) + np.repeat(text_starts - window_offsets, window_counts)
+        return rolling[positions], window_offsets
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """Computes a (len(texts), num_perm) MinHash signature matrix.
+
+        Args:
+            texts (List[str]): The texts to sign.
+
+        Returns:
+            numpy.ndarray: One row of 32-bit MinHash values per text.
+        """
+        return self._signatures([self._normalize(text) for text in texts])
+
+    def _signatures(self, normalized: List[str]) -> np.ndarray:
+        signatures = np.empty((len(normalized), self.num_perm), dtype=np.uint64)
+        sizes = [max(len(text), self.shingle_size) for text in normalized]
+        chunk_start = 0
+        while chunk_start < len(normalized):
+            # Grow the chunk up to chunk_shingles characters, always taking at least one text.
+            chunk_end, chunk_length = chunk_start + 1, sizes[chunk_start]
+            while chunk_end < len(normalized) and chunk_length + sizes[chunk_end] <= self.chunk_shingles:
+                chunk_length += sizes[chunk_end]
+                chunk_end += 1
+            hashes, offsets = self._shingle_hashes(normalized[chunk_start:chunk_end])
+            permuted = (self._a * hashes + self._b) >> np.uint64(32)
+            signatures[chunk_start:chunk_end] = np.minimum.reduceat(permuted, offsets, axis=1).T
+            chunk_start = chunk_end
+        return signatures
+
+    def find_clusters(self, texts: List[str]) -> np.ndarray:
+        """Assigns every text to a cluster of near-duplicates.
+
+        Args:
+            texts (List[str]): The texts to cluster.
+
+        Returns:
+            numpy.ndarray: For each text, the index of its cluster's representative,
+            which is the earliest text in that cluster. Texts with no word
+            characters (emoji-only, punctuation-only or empty) are never merged.
+        """
+        normalized = [self._normalize(text) for text in texts]
+        representatives = np.arange(len(texts))
+        clusterable = np.array([index for index, text in enumerate(normalized) if text], dtype=np.int64)
+        n_texts = len(clusterable)
+        if n_texts < 2:
+            return representatives
+        parents = np.arange(n_texts)
+
+        def find(node: int) -> int:
+            root = node
+            while parents[root] != root:
+                root = parents[root]
+            while parents[node] != root:
+                parents[node], node = root, parents[node]
+            return root
+
+        signatures = self._signatures([normalized[index] for index in clusterable])
+        for band in range(self.bands):
+            band_rows = np.ascontiguousarray(signatures[:, band * self.rows:(band + 1) * self.rows])
+            keys = band_rows.view(np.dtype((np.void, band_rows.dtype.itemsize * self.rows))).ravel()
+            _, first_in_bucket, bucket_ids = np.unique(keys, return_index=True, return_inverse=True)
+            anchors = first_in_bucket[bucket_ids.ravel()]
+            candidates = np.nonzero(anchors != np.arange(n_texts))[0]
+            if not len(candidates):
+                continue
+            similarity = (signatures[candidates] == signatures[anchors[candidates]]).mean(axis=1)
+            matches = candidates[similarity >= self.threshold]
+            for node, anchor in zip(matches, anchors[matches]):
+                node_root, anchor_root = find(int(node)), find(int(anchor))
+                if node_root != anchor_root:
+                    # The smaller index wins so each representative is the first occurrence.
+                    parents[max(node_root, anchor_root)] = min(node_root, anchor_root)
+
+        # clusterable is ascending, so the earliest local index maps to the earliest text.
+        representatives[clusterable] = clusterable[[find(node) for node in range(n_texts)]]
+        logger.info(f"Deduplicated {len(texts)} texts into {len(np.unique(representatives))} clusters.")
+        return representatives
@@ -1,13 +1,28 @@
 import logging
+import os
+from typing import List
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from underthesea import sentiment as underthesea_sentiment
+from src.services.vietnamese_lexicon_scorer import VietnameseLexiconScorer
+from src.logging_config import get_sampled_logger
 
 logger = logging.getLogger(__name__)
+hot_path_logger = get_sampled_logger(__name__)
+
+VI_BACKENDS = ("underthesea", "lexicon")
 
 class SentimentService:
     """Service for performing sentiment analysis on text in English and Vietnamese."""
-    def __init__(self):
+    def __init__(self, vi_backend: str = None):
         self.vader_analyzer = SentimentIntensityAnalyzer()
+        # The Vietnamese backend can be picked per instance or through VI_SENTIMENT_BACKEND.
+        self.vi_backend = (vi_backend or os.getenv("VI_SENTIMENT_BACKEND", "underthesea")).lower()
+        if self.vi_backend not in VI_BACKENDS:
+            raise ValueError(f"Unsupported Vietnamese sentiment backend: {self.vi_backend}. Expected one of {VI_BACKENDS}.")
+        self.vi_lexicon_scorer = None
+        if self.vi_backend == "lexicon":
+            self.vi_lexicon_scorer = VietnameseLexiconScorer()
+            return
         # underthesea models are typically loaded on first use.
         # We can try to trigger a small analysis to ensure it's ready.
         try:
@@ -34,7 +49,7 @@ class SentimentService:
             return "Neutral"
 
     def analyze_vietnamese_sentiment(self, text: str) -> str:
-        """Analyzes the sentiment of Vietnamese text using underthesea.
+        """Analyzes the sentiment of Vietnamese text using the configured backend.
 
         Args:
             text (str): The Vietnamese text to analyze.
@@ -42,13 +57,68 @@ class SentimentService:
         Returns:
             str: The sentiment label (Positive, Negative, or Neutral).
         """
+        if self.vi_lexicon_scorer is not None:
+            return self.analyze_vietnamese_sentiment_batch([text])[0]
         try:
             sentiment_result = underthesea_sentiment(text)
             return sentiment_result[0].capitalize()
         except Exception as e:
-            logger.error(f"Error analyzing Vietnamese sentiment with underthesea: {e}")
+            logger.error("Error analyzing Vietnamese sentiment with underthesea: %s", e)
             return "Neutral" # Fallback to neutral on error
 
+    def vietnamese_compound_scores(self, texts: List[str]):
+        """Returns VADER-style compound scores for a batch of Vietnamese texts.
+
+        Only available with the "lexicon" backend, since underthesea yields labels only.
+
+        Args:
+            texts (List[str]): The Vietnamese texts to score.
+
+        Returns:
+            numpy.ndarray: One compound score in [-1, 1] per text.
+        """
+        if self.vi_lexicon_scorer is None:
+            raise RuntimeError("Compound scores for Vietnamese require the 'lexicon' backend.")
+        return self.vi_lexicon_scorer.compound_scores(texts)
+
+    def analyze_vietnamese_sentiment_batch(self, texts: List[str]) -> List[str]:
+        """Analyzes the sentiment of a batch of Vietnamese texts.
+
+        Args:
+            texts (List[str]): The Vietnamese texts to analyze.
+
+        Returns:
+            List[str]: One sentiment label per text, in input order.
+        """
+        if self.vi_lexicon_scorer is None:
+            return [self.analyze_vietnamese_sentiment(text) for text in texts]
+        return self.vi_lexicon_scorer.labels_from_compound(self.vietnamese_compound_scores(texts))
+
+    def analyze_sentiment_batch(self, texts: List[str], langs: List[str]) -> List[str]:
+        """Analyzes the sentiment of a batch of texts, grouping them by language.
+
+        Args:
+            texts (List[str]): The texts to analyze.
+            langs (List[str]): The language of each text ('en' or 'vi').
+
+        Returns:
+            List[str]: One sentiment label per text, in input order.
+        """
+        logger.debug("Analyzing sentiment for a batch of %d texts.", len(texts))
+        labels: List[str] = [""] * len(texts)
+        vi_positions = []
+        for position, (text, lang) in enumerate(zip(texts, langs)):
+            # Runs once per comment: lazily formatted, DEBUG-level and sampled.
+            hot_path_logger.debug("Analyzing sentiment for text (lang: %s): %.50s...", lang, text)
+            if lang.lower() == "vi":
+                vi_positions.append(position)
+            else:
+                labels[position] = self.analyze_english_sentiment(text)
+        vi_labels = self.analyze_vietnamese_sentiment_batch([texts[position] for position in vi_positions])
+        for position, label in zip(vi_positions, vi_labels):
+            labels[position] = label
+        return labels
+
     def analyze_sentiment(self, text: str, lang: str = "en") -> str:
         """Analyzes the sentiment of text, supporting English and Vietnamese.
 
@@ -59,7 +129,7 @@ class SentimentService:
         Returns:
             str: The sentiment label (Positive, Negative, or Neutral).
         """
-        logger.info(f"Analyzing sentiment for text (lang: {lang}): {text[:50]}...")
+        hot_path_logger.debug("Analyzing sentiment for text (lang: %s): %.50s...", lang, text)
         if lang.lower() == "en":
             return self.analyze_english_sentiment(text)
         elif lang.lower() == "vi":
@@ -0,0 +1,206 @@
+import logging
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Valences follow the VADER convention (roughly -4 .. +4 per entry).
+# Multi-syllable words are written with spaces and compiled as n-gram features.
+VIETNAMESE_LEXICON: Dict[str, float] = {
+    # Positive
+    "hay": 2.0, "tốt": 2.0, "đẹp": 2.1, "thích": 2.0, "yêu": 2.6, "vui": 2.0,
+    "tuyệt": 2.8, "tuyệt vời": 3.2, "xuất sắc": 3.2, "hoàn hảo": 3.0,
+    "ổn": 1.2, "hài lòng": 2.4, "ưng": 1.8, "ưng ý": 2.2,
+    "đỉnh": 2.6, "xịn": 2.0, "dễ thương": 2.2, "cute": 1.8,
+    "cảm ơn": 1.6, "hạnh phúc": 2.8, "tuyệt đỉnh": 3.0, "ý nghĩa": 1.8,
+    "hữu ích": 2.0, "bổ ích": 2.0, "chuyên nghiệp": 1.8, "ngon": 2.0,
+    "ấn tượng": 2.0, "thú vị": 2.0, "hấp dẫn": 2.0, "cuốn": 1.6,
+    "giỏi": 2.0, "tài năng": 2.4, "dễ hiểu": 1.6, "nhanh": 0.8,
+    "ủng hộ": 1.8, "khen": 1.8, "tự hào": 2.2, "cảm động": 1.8,
+    "hài hước": 1.8, "vui vẻ": 2.0, "đáng xem": 2.2, "recommend": 1.8,
+    "love": 2.8, "good": 1.8, "great": 2.6, "nice": 1.8, "best": 2.8,
+    # Negative
+    "dở": -2.2, "tệ": -2.6, "kém": -2.0, "xấu": -2.0, "ghét": -2.8,
+    "chán": -2.0, "buồn": -1.8, "thất vọng": -2.8, "tồi": -2.6, "tồi tệ": -3.2,
+    "nhảm": -2.0, "nhảm nhí": -2.6, "vớ vẩn": -2.2, "xàm": -2.0,
+    "lừa đảo": -3.2, "lừa": -2.2, "dối trá": -2.8,
+    "phí": -1.4, "phí thời gian": -2.6, "nhàm chán": -2.4, "khó chịu": -2.2,
+    "bực": -2.0, "bực mình": -2.4, "kinh khủng": -3.0, "ngu": -2.8,
+    "sai": -1.4, "lỗi": -1.6, "chậm": -1.0, "rác": -2.6, "đắt": -1.0,
+    "tức": -2.0, "tức giận": -2.6, "phản cảm": -2.6, "vô duyên": -2.2,
+    "vô lý": -2.0, "nhạt": -1.6, "câu view": -2.0, "spam": -1.8,
+    "hate": -2.8, "bad": -2.2, "worst": -3.0,
+}
+
+# Negators flip and damp any lexicon entry starting within NEGATION_WINDOW tokens after them,
+# so fillers and boosters in between ("không quá hay", "chẳng hề tốt") are still covered.
+NEGATIONS: Tuple[str, ...] = ("không", "chẳng", "chả", "chưa", "đâu có")
+BOOSTERS_BEFORE: Tuple[str, ...] = ("rất", "cực", "cực kỳ", "siêu", "vô cùng", "thật", "thật sự", "quá")
+BOOSTERS_AFTER: Tuple[str, ...] = ("quá", "lắm", "thật", "vãi", "cực")
+
+# Constants shared with vaderSentiment so the compound scores are comparable.
+NEGATION_SCALAR = -0.74
+NEGATION_WINDOW = 3
+BOOSTER_INCREMENT = 0.293
+NORMALIZATION_ALPHA = 15.0
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _normalize(text: str) -> List[str]:
+    """Lower-cases, NFC-normalizes and splits text into syllables."""
+    return _TOKEN_PATTERN.findall(unicodedata.normalize("NFC", text).lower())
+
+
+class VietnameseLexiconScorer:
+    """Lightweight Vietnamese sentiment scorer over syllable n-gram features.
+
+    The lexicon and booster rules are compiled once into phrases over a
+    syllable vocabulary, each phrase encoded as an integer key. A batch is
+    scored in NumPy: tokens are mapped to syllable ids with ``searchsorted``,
+    n-gram keys are built for the whole batch at once and matched against the
+    sorted phrase keys, negators flip hits within ``NEGATION_WINDOW`` tokens,
+    and ``np.bincount`` sums the weights per document. The raw sum is squashed
+    into a VADER-style compound score in [-1, 1].
+    """
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None):
+        self.lexicon = dict(VIETNAMESE_LEXICON if lexicon is None else lexicon)
+        phrases = self._compile(self.lexicon)
+        negations = {" ".join(_normalize(negation)): (0.0, 0) for negation in NEGATIONS}
+
+        # Syllable ids start at 1; 0 marks a syllable outside the vocabulary.
+        self.syllables = np.array(sorted({token for phrase in [*phrases, *negations] for token in phrase.split()}))
+        self._base = len(self.syllables) + 1
+        self.max_ngram = max(len(phrase.split()) for phrase in [*phrases, *negations])
+        if self._base ** self.max_ngram >= 2 ** 63:
+            raise ValueError("Lexicon too large to encode its phrases as int64 keys.")
+        self._phrase_table = self._key_table(phrases)
+        self._negation_table = self._key_table(negations)
+        logger.info(
+            f"Vietnamese lexicon scorer compiled: {len(self.lexicon)} entries, "
+            f"{len(phrases)} phrase features, n-grams up to {self.max_ngram}."
+        )
+
+    def _compile(self, lexicon: Dict[str, float]) -> Dict[str, Tuple[float, int]]:
+        """Folds lexicon entries and booster rules into phrase weights.
+
+        Every rule is first expressed as the total valence a phrase should get,
+        e.g. ``"rất tốt"`` gets ``valence("tốt") + BOOSTER_INCREMENT``. Phrases
+        are then compiled shortest first, each keeping only the residual left
+        after its shorter sub-n-grams, so summing a text's n-gram weights
+        reproduces every phrase total exactly.
+
+        Returns:
+            Dict[str, Tuple[float, int]]: For each phrase, its residual weight and
+            the token offset of the lexicon entry inside it, which anchors the
+            negation window.
+        """
+        targets: Dict[str, Tuple[float, int]] = {}
+        for entry, valence in lexicon.items():
+            entry = " ".join(_normalize(entry))
+            if entry:
+                targets.setdefault(entry, (valence, 0))
+        for entry, (valence, _) in list(targets.items()):
+            boost = BOOSTER_INCREMENT if valence > 0 else -BOOSTER_INCREMENT
+            for booster in BOOSTERS_BEFORE:
+                targets.setdefault(f"{booster} {entry}", (valence + boost, len(booster.split())))
+            for booster in BOOSTERS_AFTER:
+                targets.setdefault(f"{entry} {booster}", (valence + boost, 0))
+
+        residuals: Dict[str, Tuple[float, int]] = {}
+        for phrase in sorted(targets, key=lambda p: len(p.split())):
+            tokens = phrase.split()
+            covered = sum(
+                residuals.get(" ".join(tokens[start:start + n]), (0.0, 0))[0]
+                for n in range(1, len(tokens))
+                for start in range(len(tokens) - n + 1)
+            )
+            total, offset = targets[phrase]
+            residuals[phrase] = (total - covered, offset)
+        return residuals
+
+    def _syllable_ids(self, tokens: np.ndarray) -> np.ndarray:
+        positions = np.searchsorted(self.syllables, tokens).clip(max=len(self.syllables) - 1)
+        return np.where(self.syllables[positions] == tokens, positions + 1, 0).astype(np.int64)
+
+    def _key_table(self, phrases: Dict[str, Tuple[float, int]]) -> Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Groups phrases by length into sorted int64 keys with aligned weight and offset arrays."""
+        table: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for n in range(1, self.max_ngram + 1):
+            group = [phrase for phrase in phrases if len(phrase.split()) == n]
+            if not group:
+                continue
+            ids = self._syllable_ids(np.array([token for phrase in group for token in phrase.split()])).reshape(-1, n)
+            keys = (ids * self._base ** np.arange(n, dtype=np.int64)).sum(axis=1)
+            order = np.argsort(keys)
+            weights, offsets = zip(*(phrases[group[index]] for index in order))
+            table[n] = (keys[order], np.array(weights, dtype=np.float64), np.array(offsets, dtype=np.int64))
+        return table
+
+    def _match(self, table, syllable_ids: np.ndarray, text_ends: np.ndarray):
+        """Yields (n, start positions, table indices) for n-grams found in ``table``."""
+        keys = np.zeros(len(syllable_ids), dtype=np.int64)
+        known = np.ones(len(syllable_ids), dtype=bool)
+        for n in range(1, self.max_ngram + 1):
+            # Extend every n-gram key by one syllable; starts too close to their text's end drop out.
+            n_starts = len(syllable_ids) - n + 1
+            if n_starts <= 0:
+                break
+            keys = keys[:n_starts] + syllable_ids[n - 1:] * self._base ** (n - 1)
+            known = known[:n_starts] & (syllable_ids[n - 1:] > 0)
+            if n not in table:
+                continue
+            sorted_keys = table[n][0]
+            starts = np.nonzero(known & (np.arange(n_starts) + n <= text_ends[:n_starts]))[0]
+            found = np.searchsorted(sorted_keys, keys[starts]).clip(max=len(sorted_keys) - 1)
+            hits = sorted_keys[found] == keys[starts]
+            yield n, starts[hits], found[hits]
+
+    def raw_scores(self, texts: Iterable[str]) -> np.ndarray:
+        """Returns the un-normalized summed valence for every text in the batch."""
+        tokenized = [_normalize(text) for text in texts]
+        n_docs = len(tokenized)
+        lengths = np.array([len(tokens) for tokens in tokenized], dtype=np.int64)
+        if not lengths.sum():
+            return np.zeros(n_docs, dtype=np.float64)
+        syllable_ids = self._syllable_ids(np.array([token for tokens in tokenized for token in tokens]))
+        doc_ids = np.repeat(np.arange(n_docs), lengths)
+        text_ends = np.cumsum(lengths)[doc_ids]
+        text_starts = text_ends - lengths[doc_ids]
+
+        # Mark the last token of every negator, then count them with a prefix sum.
+        negators = np.zeros(len(syllable_ids) + 1, dtype=np.int64)
+        for n, starts, _ in self._match(self._negation_table, syllable_ids, text_ends):
+            negators[starts + n] = 1
+        negator_counts = np.cumsum(negators)
+
+        scores = np.zeros(n_docs, dtype=np.float64)
+        for n, starts, found in self._match(self._phrase_table, syllable_ids, text_ends):
+            _, phrase_weights, phrase_offsets = self._phrase_table[n]
+            weights = phrase_weights[found]
+            anchors = starts + phrase_offsets[found]
+            window_starts = np.maximum(anchors - NEGATION_WINDOW, text_starts[starts])
+            negated = negator_counts[anchors] > negator_counts[window_starts]
+            weights[negated] *= NEGATION_SCALAR
+            scores += np.bincount(doc_ids[starts], weights=weights, minlength=n_docs)
+        return scores
+
+    def compound_scores(self, texts: Iterable[str]) -> np.ndarray:
+        """Returns VADER-style compound scores in [-1, 1] for a batch of texts."""
+        raw = self.raw_scores(texts)
+        return raw / np.sqrt(raw * raw + NORMALIZATION_ALPHA)
+
+    def polarity_scores(self, text: str) -> Dict[str, float]:
+        """Scores a single text, mirroring ``SentimentIntensityAnalyzer.polarity_scores``'s compound key."""
+        return {"compound": float(self.compound_scores([text])[0])}
+
+    @staticmethod
+    def labels_from_compound(compound: np.ndarray, threshold: float = 0.05) -> List[str]:
+        """Maps compound scores to Positive/Negative/Neutral with VADER's default thresholds."""
+        labels = np.full(compound.shape, "Neutral", dtype=object)
+        labels[compound >= threshold] = "Positive"
+        labels[compound <= -threshold] = "Negative"
+        return labels.tolist()
@@ -0,0 +1,49 @@
+import random
+import time
+import tracemalloc
+from src.services.deduplication_service import DeduplicationService
+
+WORDS = "hay quá tuyệt video bạn kênh xem thích rất mình nhạc phim great love cool nice song wow".split()
+
+def make_comments(count, seed=0):
+    rng = random.Random(seed)
+    comments = [" ".join(rng.choices(WORDS, k=rng.randint(3, 15))) for _ in range(count * 9 // 10)]
+    comments += [f"Subscribe to my channel for a free giveaway number {i}!!" for i in range(count // 10)]
+    rng.shuffle(comments)
+    return comments
+
+def test_deduplication_scales_linearly():
+    """Clusters 100k comments within budget and checks the cost grows roughly linearly."""
+    service = DeduplicationService()
+    timings = {}
+    for count in (25_000, 100_000):
+        comments = make_comments(count)
+        start_time = time.perf_counter()
+        representatives = service.find_clusters(comments)
+        timings[count] = time.perf_counter() - start_time
+        assert len(representatives) == count
+
+    print(f"\ndeduplication: {100_000 / timings[100_000]:,.0f} comments/s on 100k comments, "
+          f"100k/25k time ratio {timings[100_000] / timings[25_000]:.2f}")
+    assert timings[100_000] < 60, f"Deduplication took too long: {timings[100_000]:.2f} seconds"
+    # Four times the comments should cost well under the quadratic factor of sixteen.
+    assert timings[100_000] / timings[25_000] < 8
+
+def test_deduplication_memory_is_bounded_for_long_comments():
+    """Signs 2k comments of ~10k characters while keeping peak memory bounded."""
+    rng = random.Random(1)
+    comments = [" ".join(rng.choices(WORDS, k=2_500))[:10_000] for _ in range(2_000)]
+    service = DeduplicationService()
+
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        representatives = service.find_clusters(comments)
+        elapsed_time = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(f"\ndeduplication of 2k long comments: {elapsed_time:.2f} s, peak memory {peak / 2 ** 20:.0f} MiB")
+    assert len(representatives) == len(comments)
+    assert peak < 512 * 2 ** 20, f"Peak memory too high: {peak / 2 ** 20:.0f} MiB"
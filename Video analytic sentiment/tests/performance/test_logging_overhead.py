@@ -0,0 +1,85 @@
+import logging
+import os
+import statistics
+import time
+import pytest
+from src.logging_config import setup_logging, stop_logging, TEXT_FORMAT
+import src.services.sentiment_service as sentiment_module
+from src.services.sentiment_service import SentimentService
+
+N_COMMENTS = 10_000
+REPEATS = 9
+COMMENTS = [
+    f"Comment number {i}: this video is great, I really loved it!" if i % 2 else f"Bình luận số {i}: video này hay quá, cảm ơn bạn!"
+    for i in range(N_COMMENTS)
+]
+LANGS = ["en" if i % 2 else "vi" for i in range(N_COMMENTS)]
+
+@pytest.fixture(scope="module")
+def sentiment_service():
+    return SentimentService(vi_backend="lexicon")
+
+@pytest.fixture
+def devnull():
+    root = logging.getLogger()
+    root_level = root.level
+    with open(os.devnull, "w") as sink:
+        yield sink
+    logging.disable(logging.NOTSET)
+    stop_logging()
+    root.setLevel(root_level)
+
+class LegacyHotPathLogger:
+    """Replays the per-comment line as it was logged before: an eager f-string at INFO."""
+    def debug(self, msg, lang, text):
+        sentiment_module.logger.info(f"Analyzing sentiment for text (lang: {lang}): {text[:50]}...")
+
+def test_logging_overhead_on_comment_loop(sentiment_service, devnull, monkeypatch):
+    """Reports the per-comment time of the batch scoring loop before and after the non-blocking setup."""
+    root = logging.getLogger()
+    legacy_handler = logging.StreamHandler(devnull)
+    legacy_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    sampled_logger = sentiment_module.hot_path_logger
+
+    def configure_disabled():
+        stop_logging()
+        monkeypatch.setattr(sentiment_module, "hot_path_logger", sampled_logger)
+        logging.disable(logging.CRITICAL)
+
+    def configure_legacy():
+        # Before: synchronous StreamHandler on the root logger and an INFO line per comment.
+        logging.disable(logging.NOTSET)
+        root.addHandler(legacy_handler)
+        root.setLevel(logging.INFO)
+        monkeypatch.setattr(sentiment_module, "hot_path_logger", LegacyHotPathLogger())
+
+    def configure_info():
+        # After: queue-based listener, hot-path line at DEBUG and therefore skipped at INFO.
+        root.removeHandler(legacy_handler)
+        monkeypatch.setattr(sentiment_module, "hot_path_logger", sampled_logger)
+        setup_logging(level="INFO", json_output=True, logger_levels={}, debug_sample_rate=100, stream=devnull)
+
+    def configure_debug_sampled():
+        # After, with DEBUG enabled: the hot-path line is sampled 1 in 100.
+        setup_logging(level="DEBUG", json_output=True, logger_levels={}, debug_sample_rate=100, stream=devnull)
+
+    scenarios = {
+        "no logging": configure_disabled,
+        "before": configure_legacy,
+        "after (INFO)": configure_info,
+        "after (DEBUG, sampled 1/100)": configure_debug_sampled,
+    }
+    # Interleave the scenarios so machine noise hits each of them alike, then take medians.
+    timings = {name: [] for name in scenarios}
+    for _ in range(REPEATS):
+        for name, configure in scenarios.items():
+            configure()
+            start_time = time.perf_counter()
+            sentiment_service.analyze_sentiment_batch(COMMENTS, LANGS)
+            timings[name].append(time.perf_counter() - start_time)
+    root.removeHandler(legacy_handler)
+
+    per_comment = {name: statistics.median(runs) / N_COMMENTS * 1e6 for name, runs in timings.items()}
+    print(f"\nmedian time per comment of analyze_sentiment_batch over {N_COMMENTS} comments x {REPEATS} runs: "
+          + ", ".join(f"{name} {value:.2f} us" for name, value in per_comment.items()))
+    assert per_comment["after (INFO)"] < per_comment["before"]
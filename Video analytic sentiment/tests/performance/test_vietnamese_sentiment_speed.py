@@ -0,0 +1,58 @@
+import csv
+import os
+import time
+import pytest
+from src.services.sentiment_service import SentimentService, underthesea_sentiment
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), "data", "vi_sentiment_sample.tsv")
+BATCH_SIZE = 100_000
+
+def load_sample():
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f, delimiter="\t"))
+    return [row["text"] for row in rows], [row["label"] for row in rows]
+
+def agreement(left, right):
+    return sum(a == b for a, b in zip(left, right)) / len(left)
+
+@pytest.fixture(scope="module")
+def lexicon_service():
+    return SentimentService(vi_backend="lexicon")
+
+def test_lexicon_backend_throughput_and_accuracy(lexicon_service):
+    """Reports lexicon backend throughput on a 100k-comment batch and accuracy on the labeled sample."""
+    texts, gold = load_sample()
+    labels = lexicon_service.analyze_vietnamese_sentiment_batch(texts)
+    accuracy = agreement(labels, gold)
+
+    batch = (texts * (BATCH_SIZE // len(texts) + 1))[:BATCH_SIZE]
+    start_time = time.perf_counter()
+    lexicon_service.analyze_vietnamese_sentiment_batch(batch)
+    elapsed_time = time.perf_counter() - start_time
+    throughput = BATCH_SIZE / elapsed_time
+
+    # Accuracy is reported, not gated: the sample is small and hand-labelled.
+    print(f"\nlexicon backend: {throughput:,.0f} comments/s over {BATCH_SIZE} comments, "
+          f"accuracy on labeled sample: {accuracy:.2%}")
+    assert len(labels) == len(gold)
+    assert elapsed_time < 60, f"Lexicon scoring took too long: {elapsed_time:.2f} seconds"
+
+def test_lexicon_backend_agreement_with_underthesea(lexicon_service):
+    """Reports per-comment underthesea throughput and its agreement with the lexicon backend."""
+    texts, gold = load_sample()
+    # The service swallows underthesea errors, so probe the model directly first.
+    try:
+        underthesea_sentiment(texts[0])
+    except Exception as e:
+        pytest.skip(f"underthesea sentiment model unavailable: {e}")
+    underthesea_service = SentimentService(vi_backend="underthesea")
+
+    start_time = time.perf_counter()
+    underthesea_labels = underthesea_service.analyze_vietnamese_sentiment_batch(texts)
+    elapsed_time = time.perf_counter() - start_time
+    lexicon_labels = lexicon_service.analyze_vietnamese_sentiment_batch(texts)
+
+    print(f"\nunderthesea backend: {len(texts) / elapsed_time:,.0f} comments/s, "
+          f"accuracy on labeled sample: {agreement(underthesea_labels, gold):.2%}, "
+          f"agreement with lexicon backend: {agreement(underthesea_labels, lexicon_labels):.2%}")
+    assert set(underthesea_labels) <= {"Positive", "Negative", "Neutral"}
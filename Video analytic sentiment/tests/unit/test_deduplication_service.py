@@ -0,0 +1,86 @@
+import random
+import numpy as np
+import pytest
+from src.services.deduplication_service import DeduplicationService
+
+@pytest.fixture
+def deduplication_service():
+    return DeduplicationService()
+
+def test_near_duplicates_share_first_occurrence(deduplication_service):
+    texts = [
+        "Video này hay quá, cảm ơn bạn!",
+        "video này hay quá cảm ơn bạn",
+        "Hôm nay trời mưa",
+        "Video này hay quá, cảm ơn bạn!!!",
+    ]
+    assert deduplication_service.find_clusters(texts).tolist() == [0, 0, 2, 0]
+
+def test_spam_variants_are_grouped(deduplication_service):
+    texts = [
+        "Totally unrelated opinion about the music",
+        "Check out my channel for free giftcards http://spam.example",
+        "check out my channel for FREE giftcards http://spam.example/1",
+        "Check out my channel for free giftcards!! http://spam.example",
+    ]
+    assert deduplication_service.find_clusters(texts).tolist() == [0, 1, 1, 1]
+
+def test_distinct_comments_stay_separate(deduplication_service):
+    texts = ["Great video!", "Terrible audio quality", "Where was this filmed?", "ok", ""]
+    assert deduplication_service.find_clusters(texts).tolist() == [0, 1, 2, 3, 4]
+
+def test_short_and_empty_texts(deduplication_service):
+    assert deduplication_service.find_clusters([]).tolist() == []
+    assert deduplication_service.find_clusters(["ok"]).tolist() == [0]
+    assert deduplication_service.find_clusters(["ok", "OK!", ""]).tolist() == [0, 0, 2]
+
+def test_texts_without_word_characters_are_not_merged(deduplication_service):
+    texts = ["😍😍😍", "😡😡", "!!!", "😢", "❤️", "", "Great video!", "great video"]
+    assert deduplication_service.find_clusters(texts).tolist() == [0, 1, 2, 3, 4, 5, 6, 6]
+
+def test_signatures_are_deterministic_and_chunk_independent():
+    texts = ["first comment here", "second comment here", "a third, longer comment with more words"] * 3
+    chunked = DeduplicationService(chunk_shingles=20).signatures(texts)
+    whole = DeduplicationService(chunk_shingles=1 << 16).signatures(texts)
+    assert chunked.shape == (9, 64)
+    np.testing.assert_array_equal(chunked, whole)
+    np.testing.assert_array_equal(chunked[0], chunked[3])
+
+def shingle_jaccard(service, left, right):
+    def shingles(text):
+        text = service._normalize(text).ljust(service.shingle_size)
+        return {text[start:start + service.shingle_size] for start in range(len(text) - service.shingle_size + 1)}
+    left, right = shingles(left), shingles(right)
+    return len(left & right) / len(left | right)
+
+def near_duplicate_pairs(service, low, high, count, seed=0):
+    """Builds comment pairs by word substitution whose shingle Jaccard lies in [low, high)."""
+    rng = random.Random(seed)
+    words = "hay quá tuyệt video bạn kênh xem thích rất mình nhạc phim great love cool nice song wow".split()
+    pairs = []
+    while len(pairs) < count:
+        left = [rng.choice(words) for _ in range(rng.randint(8, 20))]
+        right = list(left)
+        for _ in range(rng.randint(1, 4)):
+            right[rng.randrange(len(right))] = rng.choice(words)
+        left, right = " ".join(left), " ".join(right)
+        if low <= shingle_jaccard(service, left, right) < high:
+            pairs.append((left, right))
+    return pairs
+
+def test_banding_makes_pairs_at_threshold_candidates(deduplication_service):
+    # A pair is an LSH candidate when all rows of at least one band agree.
+    pairs = near_duplicate_pairs(deduplication_service, 0.7, 0.75, 200)
+    signatures = deduplication_service.signatures([text for pair in pairs for text in pair])
+    bands = (signatures[0::2] == signatures[1::2]).reshape(len(pairs), deduplication_service.bands, -1)
+    assert bands.all(axis=2).any(axis=1).mean() >= 0.95
+
+def test_pair_above_threshold_is_merged(deduplication_service):
+    left = "subscribe to my channel for free giftcards every day"
+    right = "subscribe to my channel to get free giftcards every day"
+    assert 0.7 <= shingle_jaccard(deduplication_service, left, right) < 0.75
+    assert deduplication_service.find_clusters([left, right]).tolist() == [0, 0]
+
+def test_invalid_banding():
+    with pytest.raises(ValueError):
+        DeduplicationService(num_perm=64, bands=10)
@@ -0,0 +1,112 @@
+import io
+import json
+import logging
+import pytest
+from src.logging_config import (
+    setup_logging, stop_logging, parse_logger_levels, get_sampled_logger, SnapshotQueueHandler, request_id_var, job_id_var
+)
+
+@pytest.fixture
+def log_stream():
+    root_level = logging.getLogger().level
+    stream = io.StringIO()
+    yield stream
+    stop_logging()
+    logging.getLogger().setLevel(root_level)
+    logging.getLogger("tests.quiet").setLevel(logging.NOTSET)
+
+def test_json_output_carries_context_ids_and_extras(log_stream):
+    setup_logging(level="INFO", json_output=True, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+    request_token = request_id_var.set("req-1")
+    job_token = job_id_var.set("job-1")
+    try:
+        logging.getLogger("tests.json").info("Scored %d comments", 3, extra={"video_url": "https://example.com"})
+    finally:
+        request_id_var.reset(request_token)
+        job_id_var.reset(job_token)
+    stop_logging()
+
+    record = json.loads(log_stream.getvalue().strip())
+    assert record["message"] == "Scored 3 comments"
+    assert record["level"] == "INFO"
+    assert record["logger"] == "tests.json"
+    assert record["request_id"] == "req-1"
+    assert record["job_id"] == "job-1"
+    assert record["video_url"] == "https://example.com"
+
+def test_records_are_snapshotted_when_logged(log_stream):
+    setup_logging(level="INFO", json_output=True, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+    comments = ["first"]
+    logger = logging.getLogger("tests.snapshot")
+    logger.info("Comments: %s", comments)
+    comments.append("second")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.error("Failed", exc_info=True)
+    stop_logging()
+
+    first, second = [json.loads(line) for line in log_stream.getvalue().splitlines()]
+    assert first["message"] == "Comments: ['first']"
+    assert second["message"] == "Failed"
+    assert "ValueError: boom" in second["exc_info"]
+
+def test_per_logger_levels(log_stream):
+    setup_logging(level="INFO", json_output=False, logger_levels={"tests.quiet": "ERROR"}, debug_sample_rate=1, stream=log_stream)
+    logging.getLogger("tests.quiet").warning("dropped")
+    logging.getLogger("tests.loud").warning("kept")
+    stop_logging()
+
+    output = log_stream.getvalue()
+    assert "dropped" not in output
+    assert "kept" in output
+
+def test_sampled_logger_keeps_one_in_n_debug_calls(log_stream):
+    setup_logging(level="DEBUG", json_output=False, logger_levels={}, debug_sample_rate=10, stream=log_stream)
+    logger = get_sampled_logger("tests.sampled")
+    for i in range(100):
+        logger.debug("hot path %d", i)
+    logger.info("not sampled")
+    stop_logging()
+
+    lines = log_stream.getvalue().splitlines()
+    assert sum("hot path" in line for line in lines) == 10
+    assert any("not sampled" in line for line in lines)
+
+def test_sampled_logger_reports_caller_location(log_stream):
+    setup_logging(level="DEBUG", json_output=False, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+    records = []
+    collector = logging.Handler()
+    collector.emit = records.append
+    logging.getLogger("tests.location").addHandler(collector)
+    try:
+        get_sampled_logger("tests.location").debug("where am I")
+    finally:
+        logging.getLogger("tests.location").removeHandler(collector)
+
+    assert records[0].funcName == "test_sampled_logger_reports_caller_location"
+
+def test_sampled_logger_accepts_explicit_stacklevel(log_stream):
+    setup_logging(level="DEBUG", json_output=False, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+    get_sampled_logger("tests.stacklevel").debug("explicit", stacklevel=1)
+    stop_logging()
+
+    assert "explicit" in log_stream.getvalue()
+
+def test_setup_logging_keeps_foreign_handlers(log_stream):
+    foreign = logging.NullHandler()
+    root = logging.getLogger()
+    root.addHandler(foreign)
+    try:
+        setup_logging(level="INFO", json_output=False, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+        setup_logging(level="INFO", json_output=False, logger_levels={}, debug_sample_rate=1, stream=log_stream)
+        assert foreign in root.handlers
+        # Reconfiguring replaces our own handler instead of stacking a second one.
+        assert sum(isinstance(handler, SnapshotQueueHandler) for handler in root.handlers) == 1
+        stop_logging()
+        assert not any(isinstance(handler, SnapshotQueueHandler) for handler in root.handlers)
+    finally:
+        root.removeHandler(foreign)
+
+def test_parse_logger_levels():
+    assert parse_logger_levels("src.services=warning, uvicorn=INFO,,bad") == {"src.services": "WARNING", "uvicorn": "INFO"}
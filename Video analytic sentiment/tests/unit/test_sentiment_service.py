@@ -52,4 +52,32 @@ def test_analyze_sentiment_vietnamese_explicit(mock_underthesea_sentiment_module
 def test_analyze_sentiment_unsupported_language(sentiment_service):
     text = "Hola mundo!"
     # Should default to English and return neutral for this text
-    assert sentiment_service.analyze_sentiment(text, lang="es") == "Neutral"
\ No newline at end of file
+    assert sentiment_service.analyze_sentiment(text, lang="es") == "Neutral"
+
+@pytest.fixture
+def lexicon_sentiment_service():
+    return SentimentService(vi_backend="lexicon")
+
+def test_lexicon_backend_skips_underthesea(mock_underthesea_sentiment_module, lexicon_sentiment_service):
+    assert lexicon_sentiment_service.analyze_vietnamese_sentiment("Phim này rất hay! Tôi rất thích.") == "Positive"
+    assert lexicon_sentiment_service.analyze_vietnamese_sentiment("Phim này dở tệ. Tôi ghét nó.") == "Negative"
+    mock_underthesea_sentiment_module.assert_not_called()
+
+def test_lexicon_backend_compound_scores(lexicon_sentiment_service):
+    scores = lexicon_sentiment_service.vietnamese_compound_scores(["Sản phẩm tuyệt vời!", "Thất vọng quá", "Hôm nay trời mưa"])
+    assert scores[0] > 0.05
+    assert scores[1] < -0.05
+    assert scores[2] == 0
+
+def test_compound_scores_require_lexicon_backend(sentiment_service):
+    with pytest.raises(RuntimeError):
+        sentiment_service.vietnamese_compound_scores(["Sản phẩm tuyệt vời!"])
+
+def test_unknown_vietnamese_backend():
+    with pytest.raises(ValueError):
+        SentimentService(vi_backend="unknown")
+
+def test_analyze_sentiment_batch_mixed_languages(lexicon_sentiment_service):
+    texts = ["Great product!", "Phim này dở tệ.", "This is a neutral statement.", "Video hay quá"]
+    langs = ["en", "vi", "en", "vi"]
+    assert lexicon_sentiment_service.analyze_sentiment_batch(texts, langs) == ["Positive", "Negative", "Neutral", "Positive"]
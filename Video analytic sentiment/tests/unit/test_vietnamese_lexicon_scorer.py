@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from src.services.vietnamese_lexicon_scorer import VietnameseLexiconScorer, NEGATION_SCALAR, BOOSTER_INCREMENT
+
+@pytest.fixture(scope="module")
+def scorer():
+    return VietnameseLexiconScorer()
+
+def test_single_word_valence(scorer):
+    assert scorer.raw_scores(["hay"])[0] == pytest.approx(2.0)
+
+def test_multi_syllable_entry_is_not_double_counted(scorer):
+    # "tuyệt" is also an entry on its own; the phrase total must still be the phrase valence.
+    assert scorer.raw_scores(["tuyệt vời"])[0] == pytest.approx(3.2, abs=1e-5)
+
+def test_negation_flips_and_damps(scorer):
+    assert scorer.raw_scores(["không hay"])[0] == pytest.approx(NEGATION_SCALAR * 2.0, abs=1e-5)
+    assert scorer.raw_scores(["không tuyệt vời"])[0] == pytest.approx(NEGATION_SCALAR * 3.2, abs=1e-5)
+
+@pytest.mark.parametrize("text, valence", [
+    ("không quá hay", 2.0 + BOOSTER_INCREMENT),
+    ("chẳng hề tốt", 2.0),
+    ("không được hay", 2.0),
+    ("phim không được hay lắm", 2.0 + BOOSTER_INCREMENT),
+    ("đâu có hay", 2.0),
+])
+def test_negation_reaches_across_fillers_and_boosters(scorer, text, valence):
+    assert scorer.raw_scores([text])[0] == pytest.approx(NEGATION_SCALAR * valence, abs=1e-5)
+
+def test_negation_window_is_limited_and_stays_within_a_text(scorer):
+    assert scorer.raw_scores(["không một hai ba hay"])[0] == pytest.approx(2.0)
+    np.testing.assert_allclose(scorer.raw_scores(["phim không", "hay"]), [0.0, 2.0])
+
+def test_boosters_increase_magnitude(scorer):
+    assert scorer.raw_scores(["rất hay"])[0] == pytest.approx(2.0 + BOOSTER_INCREMENT, abs=1e-5)
+    assert scorer.raw_scores(["tệ quá"])[0] == pytest.approx(-2.6 - BOOSTER_INCREMENT, abs=1e-5)
+
+def test_batch_matches_individual_scores(scorer):
+    texts = ["Phim này rất hay!", "", "Thật sự thất vọng", "Không có gì"]
+    batch = scorer.compound_scores(texts)
+    individual = np.array([scorer.polarity_scores(text)["compound"] for text in texts])
+    assert batch.shape == (4,)
+    np.testing.assert_allclose(batch, individual, rtol=1e-6)
+
+def test_compound_is_bounded(scorer):
+    compound = scorer.compound_scores(["tuyệt vời " * 50, "tệ " * 50])
+    assert np.all(np.abs(compound) < 1)
+
+def test_empty_batch(scorer):
+    assert scorer.compound_scores([]).shape == (0,)
+
+def test_labels_from_compound():
+    labels = VietnameseLexiconScorer.labels_from_compound(np.array([0.5, -0.5, 0.0, 0.05]))
+    assert labels == ["Positive", "Negative", "Neutral", "Positive"]
+
+def test_custom_lexicon():
+    custom = VietnameseLexiconScorer(lexicon={"đỉnh của chóp": 3.0})
+    assert custom.raw_scores(["video đỉnh của chóp"])[0] == pytest.approx(3.0)
+
+def test_lexicon_free_text_scores_exactly_zero(scorer):
+    # Syllables outside the lexicon and modifier lists must never pick up a weight.
+    syllables = ["giờ", "nói", "thứ", "mình", "xem", "lúc", "nhà", "trời", "mưa", "đi", "học", "ăn", "cơm", "năm", "nay"]
+    assert not any(syllable in scorer.lexicon for syllable in syllables)
+    rng = np.random.RandomState(0)
+    texts = [" ".join(rng.choice(syllables, size=rng.randint(1, 40))) for _ in range(2000)]
+    texts.append("giờ nói thứ thứ")
+    raw = scorer.raw_scores(texts)
+    assert np.all(raw == 0)
+    assert set(scorer.labels_from_compound(scorer.compound_scores(texts))) == {"Neutral"}